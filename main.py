@@ -1,13 +1,18 @@
 import os
+import re
 import time
+import secrets
+import asyncio
 import logging
-from datetime import datetime, date
-from zoneinfo import ZoneInfo
+import hashlib
+from xml.sax.saxutils import escape
 import httpx
-from fastapi.responses import Response, PlainTextResponse
+import orjson
+from fastapi.responses import Response, PlainTextResponse, RedirectResponse, ORJSONResponse
 from fastapi import FastAPI
-from supabase import create_client
-from openai import OpenAI
+from cachetools import LRUCache
+from supabase import AClient, acreate_client
+from openai import AsyncOpenAI
 import urllib.parse
 
 # --------------------
@@ -17,23 +22,37 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
 
 SUPABASE_URL = os.environ["SUPABASE_URL"]
-# Use service role on the server (best practice for server schedulers)
+# Use service role on the server (needed to upload to Storage)
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or os.environ["SUPABASE_ANON_KEY"]
-
-UK_TZ = ZoneInfo("Europe/London")
-
-DAY_MAP = {
-    "Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6
-}
-
-app = FastAPI()
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Public Storage bucket holding generated TTS audio, keyed by content hash
+TTS_CACHE_BUCKET = "tts-cache"
+# ElevenLabs caps concurrent requests per plan (single digits on most); beyond that it
+# answers 429, so renders queue here instead
+ELEVENLABS_MAX_CONCURRENCY = int(os.getenv("ELEVENLABS_MAX_CONCURRENCY", "3"))
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Created on startup
+supabase: AClient | None = None
+# Shared keep-alive client for outbound HTTP (ElevenLabs), so requests reuse
+# connections instead of paying a TCP+TLS handshake each time
+http_client: httpx.AsyncClient | None = None
+elevenlabs_slots = asyncio.Semaphore(ELEVENLABS_MAX_CONCURRENCY)
+reply_expiry_task: asyncio.Task | None = None
 
 # --------------------
 # OpenAI Companion Prompt
 # --------------------
 OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+# Async so a slow completion never blocks the event loop. No retries: a second attempt
+# can't fit in Twilio's webhook window. The timeout is per connect/read, not a total;
+# the whole turn is bounded by TURN_DEADLINE_SECONDS in twilio_voice_turn.
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, timeout=10.0, max_retries=0)
+
+# Twilio abandons a webhook after 15s. Generating and rendering the reply must both
+# finish within this, or the turn falls back to <Say>.
+TURN_DEADLINE_SECONDS = 12
+FALLBACK_REPLY = "Sorry love, I’m having a little moment. How have you been today?"
 
 COMPANION_SYSTEM_PROMPT = """
 You are Margaret from HelloAgain Calls, a calm, gentle, reflective companion making a scheduled call to an older adult in the UK.
@@ -66,126 +85,73 @@ def health():
     return {"ok": True}
 
 
-def _parse_hhmm(t: str):
-    """Parse 'HH:MM' into (hour, minute)."""
-    t = (t or "").strip()
-    parts = t.split(":")
-    if len(parts) != 2:
-        raise ValueError(f"Invalid call_time '{t}'. Expected HH:MM")
-    return int(parts[0]), int(parts[1])
-
+@app.on_event("startup")
+async def startup():
+    """
+    Opens the HTTP and Supabase clients, makes sure the greeting audio is in
+    Storage, and starts the reply expiry task.
+    (The call scheduler runs separately, see worker.py.)
+    """
+    global supabase, http_client, reply_expiry_task
 
-def _already_called_today(last_called_at: str | None, today: date) -> bool:
-    if not last_called_at:
-        return False
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+    supabase = await acreate_client(SUPABASE_URL, SUPABASE_KEY)
     try:
-        dt = datetime.fromisoformat(last_called_at.replace("Z", "+00:00")).astimezone(UK_TZ)
-        return dt.date() == today
-    except Exception:
-        return False
+        await _greeting_url()
+    except Exception as e:
+        # Not fatal: the greeting endpoint retries on first request
+        logging.exception(f"Greeting cache warm-up failed: {e}")
 
+    reply_expiry_task = asyncio.create_task(_expire_replies())
 
-def run_scheduler_tick():
-    """
-    Runs once per minute:
-    - fetch enabled schedules
-    - if a schedule matches now (day + HH:MM) and not called today:
-        - insert call_logs row
-        - update last_called_at
-    """
-    now = datetime.now(UK_TZ)
-    now_hhmm = f"{now.hour:02d}:{now.minute:02d}"
-    today = now.date()
-    dow = now.weekday()  # Mon=0
-
-    logging.info(f"[tick] UK now={now.isoformat(timespec='minutes')} (dow={dow}) checking schedules...")
-
-    # Fetch enabled schedules
-    sched_resp = (
-        supabase.table("call_schedule")
-        .select("id,user_id,day_of_week,call_time,enabled,last_called_at")
-        .eq("enabled", True)
-        .execute()
-    )
-    schedules = sched_resp.data or []
-
-    due = []
-    for s in schedules:
-        day = (s.get("day_of_week") or "").strip()
-        call_time = (s.get("call_time") or "").strip()
-
-        if day not in DAY_MAP:
-            continue
-        if DAY_MAP[day] != dow:
-            continue
-        if call_time != now_hhmm:
-            continue
-        if _already_called_today(s.get("last_called_at"), today):
-            continue
-
-        due.append(s)
-
-    if not due:
-        logging.info("[tick] No calls due this minute.")
-        return
-
-    # For each due schedule: fetch user, log the event, update last_called_at
-    for s in due:
-        user_id = s["user_id"]
-
-        user_resp = (
-            supabase.table("users")
-            .select("id,first_name,phone_number,companion_name,companion_voice,interests")
-            .eq("id", user_id)
-            .single()
-            .execute()
-        )
-        u = user_resp.data
 
-        logging.info(
-            f"[DUE] Would call user={u.get('first_name')} ({u.get('phone_number')}) "
-            f"voice={u.get('companion_voice')} companion={u.get('companion_name')} schedule_id={s.get('id')}"
-        )
+@app.on_event("shutdown")
+async def shutdown():
+    if reply_expiry_task is not None:
+        reply_expiry_task.cancel()
+    if http_client is not None:
+        await http_client.aclose()
 
-        # Insert a call log row (stub for now; later Twilio will fill duration/recording/answered)
-        supabase.table("call_logs").insert({
-            "user_id": user_id,
-            "call_time": now.astimezone(ZoneInfo("UTC")).isoformat(),
-            "duration_seconds": 0,
-            "answered": False,
-            "recording_url": None,
-            "summary": "Scheduler triggered (Twilio not yet connected).",
-            "mood": "neutral",
-            "topics": (u.get("interests") or "")
-        }).execute()
+from fastapi import Request
 
-        # Update last_called_at so we don't re-trigger today
-        supabase.table("call_schedule").update({
-            "last_called_at": now.astimezone(ZoneInfo("UTC")).isoformat()
-        }).eq("id", s["id"]).execute()
+# TwiML that doesn't depend on the request, rendered once at import
+INBOUND_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+  <Play>https://helloagain-calls-production.up.railway.app/audio/margaret-greeting.mp3</Play>
 
+  <Gather input="speech" action="/twilio/voice/turn" method="POST" speechTimeout="auto" timeout="6">
+    <Say>Go on.</Say>
+  </Gather>
 
-@app.on_event("startup")
-def startup():
-    """
-    Simple background loop: runs scheduler tick every 60 seconds.
-    (Railway Hobby plan keeps this running.)
-    """
-    import threading
+  <Say>Sorry, I didn’t catch that. Would you like to say hello?</Say>
+  <Redirect method="POST">/twilio/voice/inbound</Redirect>
+</Response>
+""".encode("utf-8")
 
-    def loop():
-        # Align roughly to the minute boundary
-        while True:
-            try:
-                run_scheduler_tick()
-            except Exception as e:
-                logging.exception(f"[tick] Error: {e}")
-            time.sleep(60)
+NO_SPEECH_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+  <Say>Sorry love, I didn’t quite catch that.</Say>
+  <Redirect method="POST">/twilio/voice/inbound</Redirect>
+</Response>""".encode("utf-8")
 
-    threading.Thread(target=loop, daemon=True).start()
-    logging.info("Scheduler started.")
+# The reply TwiML only varies by the audio token, which goes between these halves
+REPLY_TWIML_HEAD = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+  <Play>https://helloagain-calls-production.up.railway.app/audio/reply/""".encode("utf-8")
+REPLY_TWIML_TAIL = """.mp3</Play>
 
-from fastapi import Request
+  <Gather input="speech" action="/twilio/voice/turn" method="POST" speechTimeout="auto" timeout="6">
+    <Say>And?</Say>
+  </Gather>
+
+  <Say>Sorry, I didn’t catch that. Would you like to say a bit more?</Say>
+  <Redirect method="POST">/twilio/voice/inbound</Redirect>
+</Response>
+""".encode("utf-8")
 
 @app.api_route("/twilio/voice/inbound", methods=["GET", "POST"])
 async def twilio_voice_inbound(request: Request):
@@ -194,103 +160,128 @@ async def twilio_voice_inbound(request: Request):
     2) Listen for speech
     3) Send speech to /twilio/voice/turn
     """
-    twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-  <Play>https://helloagain-calls-production.up.railway.app/audio/margaret-greeting.mp3</Play>
+    return Response(content=INBOUND_TWIML, media_type="application/xml")
 
-  <Gather input="speech" action="/twilio/voice/turn" method="POST" speechTimeout="auto" timeout="6">
-    <Say>Go on.</Say>
-  </Gather>
+# Abbreviations whose full stop doesn't end a sentence ("Mr. Smith")
+_ABBREVIATIONS = ("Mr", "Mrs", "Ms", "Dr", "St", "Prof", "Rev", "e.g", "i.e")
+# A sentence ends at . ! ? or … followed by whitespace, except after an abbreviation
+_SENTENCE_END_RE = re.compile(
+    "".join(rf"(?<!\b{re.escape(a)}\.)" for a in _ABBREVIATIONS) + r"(?<=[.!?…])\s+"
+)
+# Sentences are batched into renders of at least this many characters, so a short
+# "Oh!" isn't voiced as its own clip
+MIN_TTS_CHUNK_CHARS = 40
+
+
+async def _cancel_all(tasks: list[asyncio.Task]):
+    """Cancel tasks and wait for them, logging any that had already failed."""
+    for t in tasks:
+        t.cancel()
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            logging.warning(f"TTS render failed: {result!r}")
+
+
+async def _stream_reply(user_text: str, tts_tasks: list[asyncio.Task[bytes]]) -> str:
+    """
+    Streams Margaret's reply from OpenAI. As sentences complete, starts an
+    ElevenLabs render for each MIN_TTS_CHUNK_CHARS-sized run of them and appends
+    the task to tts_tasks (in order), so speech synthesis overlaps the rest of the
+    generation. Returns the full reply.
+    """
+    chunks = []
+    chunk = ""
+    pending = ""
+
+    def start_tts(text: str):
+        # The text before this chunk keeps its intonation continuous with the last one
+        previous_text = " ".join(chunks)
+        chunks.append(text)
+        tts_tasks.append(asyncio.create_task(
+            _elevenlabs_tts(text, stream=True, previous_text=previous_text)
+        ))
+
+    async with openai_client.responses.stream(
+        model="gpt-4.1-mini",
+        input=[
+            {"role": "system", "content": COMPANION_SYSTEM_PROMPT},
+            {"role": "user", "content": user_text},
+        ],
+    ) as stream:
+        async for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+            pending += event.delta
+            *complete, pending = _SENTENCE_END_RE.split(pending)
+            for sentence in complete:
+                chunk = f"{chunk} {sentence}" if chunk else sentence
+                if len(chunk) >= MIN_TTS_CHUNK_CHARS:
+                    start_tts(chunk)
+                    chunk = ""
+
+    rest = f"{chunk} {pending.strip()}".strip()
+    if rest:
+        start_tts(rest)
+    return " ".join(chunks)
 
-  <Say>Sorry, I didn’t catch that. Would you like to say hello?</Say>
-  <Redirect method="POST">/twilio/voice/inbound</Redirect>
-</Response>
-"""
-    return Response(content=twiml, media_type="application/xml")
 
 @app.api_route("/twilio/voice/turn", methods=["POST"])
 async def twilio_voice_turn(request: Request):
     """
-    Receives Twilio speech result, asks OpenAI for a reply, converts to ElevenLabs MP3,
-    then plays it back and gathers again.
+    Receives Twilio speech result, streams a reply from OpenAI while converting each
+    finished sentence to ElevenLabs MP3, then plays it back and gathers again.
     """
     form = dict(await request.form())
     user_text = (form.get("SpeechResult") or "").strip()
 
     if not user_text:
-        twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-  <Say>Sorry love, I didn’t quite catch that.</Say>
-  <Redirect method="POST">/twilio/voice/inbound</Redirect>
-</Response>"""
-        return Response(content=twiml, media_type="application/xml")
-
-    # ---- OpenAI: generate Margaret reply ----
-    try:
-        ai = openai_client.responses.create(
-            model="gpt-4.1-mini",
-            input=[
-                {"role": "system", "content": COMPANION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_text},
-            ],
-        )
-        reply_text = (ai.output_text or "").strip()
-    except Exception as e:
-        logging.exception(f"OpenAI error: {e}")
-        reply_text = "Sorry love, I’m having a little moment. How have you been today?"
-
-    # ---- ElevenLabs: convert reply to MP3 (no caching) ----
-    api_key = os.environ["ELEVENLABS_API_KEY"]
-    voice_id = os.environ["ELEVENLABS_MARGARET_VOICE_ID"]
-    model_id = os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
-
-    tts_url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}?output_format=mp3_22050_32"
-    headers = {
-        "xi-api-key": api_key,
-        "accept": "audio/mpeg",
-        "content-type": "application/json",
-    }
-    payload = {
-        "text": reply_text,
-        "model_id": model_id,
-        "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
-    }
+        return Response(content=NO_SPEECH_TWIML, media_type="application/xml")
 
+    # ---- OpenAI + ElevenLabs: stream the reply, rendering each sentence as it completes ----
+    tts_tasks: list[asyncio.Task[bytes]] = []
+    reply_text = FALLBACK_REPLY
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            r = await client.post(tts_url, headers=headers, json=payload)
-            r.raise_for_status()
-            mp3_bytes = r.content
+        async with asyncio.timeout(TURN_DEADLINE_SECONDS):
+            try:
+                reply_text = await _stream_reply(user_text, tts_tasks)
+            except Exception as e:
+                logging.exception(f"OpenAI error: {e}")
+                await _cancel_all(tts_tasks)
+                tts_tasks = []
+                reply_text = FALLBACK_REPLY
+
+            voice_id = os.environ["ELEVENLABS_MARGARET_VOICE_ID"]
+            model_id = os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
+            tts_key = _tts_token(reply_text, voice_id, model_id)
+
+            mp3_bytes = TTS_CACHE.get(tts_key)
+            if mp3_bytes is not None:
+                await _cancel_all(tts_tasks)
+            else:
+                if tts_tasks:
+                    # MP3 frames concatenate cleanly, so the sentence renders play as one file
+                    mp3_bytes = b"".join(await asyncio.gather(*tts_tasks))
+                else:
+                    mp3_bytes = await _elevenlabs_tts(reply_text)
+                TTS_CACHE[tts_key] = mp3_bytes
     except Exception as e:
-        logging.exception(f"ElevenLabs error: {e}")
-        # fallback to Twilio <Say> if TTS fails
-        reply_for_say = reply_text.replace("&", "and").replace("<", "").replace(">", "")
+        # Includes TimeoutError when the turn misses TURN_DEADLINE_SECONDS; if that
+        # happened mid-generation, reply_text is still FALLBACK_REPLY
+        logging.exception(f"Reply audio error: {e}")
+        await _cancel_all(tts_tasks)
+        # fallback to Twilio <Say> if TTS fails or runs out of time
         twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <Response>
-  <Say>{reply_for_say}</Say>
+  <Say>{escape(reply_text)}</Say>
   <Redirect method="POST">/twilio/voice/inbound</Redirect>
 </Response>"""
         return Response(content=twiml, media_type="application/xml")
 
-    # Serve audio back via a one-off endpoint using query token? MVP hack: inline base64 isn't supported in <Play>.
-    # So simplest MVP: create a temp in-memory cache with a fixed URL.
-    # We'll store one "last reply" MP3 in memory and expose /audio/last-reply.mp3.
-
-    global LAST_REPLY_MP3
-    LAST_REPLY_MP3 = mp3_bytes
-
-    twiml = """<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-  <Play>https://helloagain-calls-production.up.railway.app/audio/last-reply.mp3</Play>
+    # Hand this turn's audio to Twilio under its own token
+    token = secrets.token_urlsafe(16)
+    REPLY_STORE[token] = (mp3_bytes, time.monotonic() + REPLY_TTL_SECONDS)
 
-  <Gather input="speech" action="/twilio/voice/turn" method="POST" speechTimeout="auto" timeout="6">
-    <Say>And?</Say>
-  </Gather>
-
-  <Say>Sorry, I didn’t catch that. Would you like to say a bit more?</Say>
-  <Redirect method="POST">/twilio/voice/inbound</Redirect>
-</Response>
-"""
+    twiml = REPLY_TWIML_HEAD + token.encode("ascii") + REPLY_TWIML_TAIL
     return Response(content=twiml, media_type="application/xml")
 
 @app.api_route("/twilio/voice/status", methods=["GET", "POST"])
@@ -303,17 +294,36 @@ async def twilio_voice_status(request: Request):
     print("TWILIO STATUS:", form)
     return PlainTextResponse("ok")
 
-LAST_REPLY_MP3: bytes | None = None
-
-@app.get("/audio/last-reply.mp3")
-async def last_reply_mp3():
-    global LAST_REPLY_MP3
-    if LAST_REPLY_MP3 is None:
-        return Response(content=b"", media_type="audio/mpeg")
-    return Response(content=LAST_REPLY_MP3, media_type="audio/mpeg")
-
-# Cache the greeting in memory so we don't regenerate every call
-MARGARET_GREETING_MP3: bytes | None = None
+# Recently rendered reply audio, keyed by _tts_token. A repeat of a recent reply is
+# served from here without waiting on its renders; only the stock fallback, which is
+# never streamed, skips ElevenLabs entirely.
+TTS_CACHE: LRUCache[str, bytes] = LRUCache(maxsize=512)
+
+# Audio for each turn, keyed by a random per-turn token in the <Play> URL, so
+# concurrent calls never hear each other's replies. Entries are held for
+# REPLY_TTL_SECONDS whatever happens to TTS_CACHE, giving Twilio time to fetch them.
+# Replies are served from memory rather than Storage: they are one-off conversation
+# audio, and an upload plus signing would add two round trips before Twilio hears back.
+# This is per-process: with several workers, move it to a shared store (e.g. Redis).
+REPLY_TTL_SECONDS = 120
+REPLY_STORE: dict[str, tuple[bytes, float]] = {}
+
+
+async def _expire_replies():
+    while True:
+        await asyncio.sleep(REPLY_TTL_SECONDS / 4)
+        now = time.monotonic()
+        for token, (_, expires_at) in list(REPLY_STORE.items()):
+            if expires_at <= now:
+                del REPLY_STORE[token]
+
+
+@app.get("/audio/reply/{token}.mp3")
+async def reply_mp3(token: str):
+    entry = REPLY_STORE.get(token)
+    if entry is None or entry[1] <= time.monotonic():
+        return Response(status_code=404)
+    return Response(content=entry[0], media_type="audio/mpeg")
 
 GREETING_TEXT = (
     "Hello, it’s Margaret from HelloAgain. "
@@ -323,31 +333,88 @@ GREETING_TEXT = (
     "If you'd like to chat just say 'hello' "
 )
 
-@app.get("/audio/margaret-greeting.mp3")
-async def margaret_greeting_mp3():
-    global MARGARET_GREETING_MP3
-    if MARGARET_GREETING_MP3 is not None:
-        return Response(content=MARGARET_GREETING_MP3, media_type="audio/mpeg")
+# Public Storage URL of the greeting MP3, resolved on startup
+GREETING_URL: str | None = None
 
+
+def _tts_token(text: str, voice_id: str, model_id: str) -> str:
+    """Cache key for a TTS render: changes whenever the text or voice does."""
+    return hashlib.sha256("\x00".join((voice_id, model_id, text)).encode("utf-8")).hexdigest()
+
+
+async def _elevenlabs_tts(text: str, stream: bool = False, previous_text: str = "") -> bytes:
+    """
+    Render text to MP3 with the Margaret voice.
+    stream=True uses the low-latency streaming endpoint, for live replies.
+    previous_text is what was spoken just before text, for natural prosody across renders.
+    """
     api_key = os.environ["ELEVENLABS_API_KEY"]
     voice_id = os.environ["ELEVENLABS_MARGARET_VOICE_ID"]
     model_id = os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
 
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}?output_format=mp3_22050_32"
+    if stream:
+        url = (
+            f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+            "?output_format=mp3_22050_32&optimize_streaming_latency=3"
+        )
+    else:
+        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}?output_format=mp3_22050_32"
     headers = {
         "xi-api-key": api_key,
         "accept": "audio/mpeg",
         "content-type": "application/json",
     }
     payload = {
-        "text": GREETING_TEXT,
+        "text": text,
         "model_id": model_id,
         "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
     }
+    if previous_text:
+        payload["previous_text"] = previous_text
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        r = await client.post(url, headers=headers, json=payload)
+    async with elevenlabs_slots, http_client.stream(
+        "POST", url, headers=headers, content=orjson.dumps(payload)
+    ) as r:
         r.raise_for_status()
-        MARGARET_GREETING_MP3 = r.content
+        return b"".join([chunk async for chunk in r.aiter_bytes()])
+
 
-    return Response(content=MARGARET_GREETING_MP3, media_type="audio/mpeg")
+async def _upload_mp3(bucket_name: str, path: str, mp3_bytes: bytes, cache_control: str = "no-store"):
+    await supabase.storage.from_(bucket_name).upload(path, mp3_bytes, {
+        "content-type": "audio/mpeg",
+        "cache-control": cache_control,
+        "upsert": "true",
+    })
+
+
+async def _cached_tts_url(text: str) -> str:
+    """
+    Public Storage URL for `text` rendered with the Margaret voice.
+    Renders and uploads it on a miss, so ElevenLabs is called once per text
+    across restarts and deploys.
+    """
+    voice_id = os.environ["ELEVENLABS_MARGARET_VOICE_ID"]
+    model_id = os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
+    key = f"{_tts_token(text, voice_id, model_id)}.mp3"
+    bucket = supabase.storage.from_(TTS_CACHE_BUCKET)
+
+    existing = await bucket.list(options={"search": key, "limit": 1})
+    if not any(f.get("name") == key for f in existing):
+        # Objects in the public cache bucket are content-addressed, so they can be
+        # cached for as long as a CDN likes
+        await _upload_mp3(TTS_CACHE_BUCKET, key, await _elevenlabs_tts(text), cache_control="31536000")
+
+    return await bucket.get_public_url(key)
+
+
+async def _greeting_url() -> str:
+    global GREETING_URL
+    if GREETING_URL is None:
+        GREETING_URL = await _cached_tts_url(GREETING_TEXT)
+    return GREETING_URL
+
+
+@app.get("/audio/margaret-greeting.mp3")
+async def margaret_greeting_mp3():
+    # Twilio follows the redirect and pulls the audio from Storage's CDN
+    return RedirectResponse(await _greeting_url(), status_code=302)
@@ -0,0 +1,4 @@
+-- run_scheduler_tick filters call_schedule by enabled/day_of_week/call_time
+-- every minute; index those columns so the lookup is an index seek.
+CREATE INDEX IF NOT EXISTS call_schedule_due_idx
+    ON call_schedule (enabled, day_of_week, call_time);
@@ -0,0 +1,8 @@
+-- Stamp last_called_at on every schedule fired in a scheduler tick with a
+-- single call instead of one PATCH per schedule.
+CREATE OR REPLACE FUNCTION update_last_called(ids uuid[], ts timestamptz)
+RETURNS void
+LANGUAGE sql
+AS $$
+    UPDATE call_schedule SET last_called_at = ts WHERE id = ANY(ids);
+$$;
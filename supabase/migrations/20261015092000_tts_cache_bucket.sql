@@ -0,0 +1,6 @@
+-- Public bucket for generated ElevenLabs audio. Objects are named by a hash of
+-- (voice, model, text), so they never change once written and can be cached
+-- at the CDN edge; Twilio fetches them directly.
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('tts-cache', 'tts-cache', true)
+ON CONFLICT (id) DO NOTHING;
@@ -0,0 +1,24 @@
+-- Everything run_scheduler_tick needs for the schedules due at a given UK day and
+-- HH:MM, with their users joined in, so a tick needs a single read.
+CREATE OR REPLACE FUNCTION due_calls(now_hhmm text, dow_name text, today_uk date)
+RETURNS TABLE (
+    schedule_id uuid,
+    user_id uuid,
+    first_name text,
+    phone_number text,
+    companion_name text,
+    companion_voice text,
+    interests text
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT s.id, u.id, u.first_name, u.phone_number, u.companion_name, u.companion_voice, u.interests
+    FROM call_schedule s
+    JOIN users u ON u.id = s.user_id
+    WHERE s.enabled
+      AND s.day_of_week = dow_name
+      AND s.call_time = now_hhmm
+      AND (s.last_called_at IS NULL
+           OR (s.last_called_at AT TIME ZONE 'Europe/London')::date < today_uk);
+$$;
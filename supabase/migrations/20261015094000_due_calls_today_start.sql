@@ -0,0 +1,26 @@
+-- Take the start of the UK day as a timestamptz instead of a date, so the
+-- "not called today" check is a plain comparison rather than a per-row
+-- AT TIME ZONE conversion.
+DROP FUNCTION IF EXISTS due_calls(text, text, date);
+
+CREATE FUNCTION due_calls(now_hhmm text, dow_name text, today_start timestamptz)
+RETURNS TABLE (
+    schedule_id uuid,
+    user_id uuid,
+    first_name text,
+    phone_number text,
+    companion_name text,
+    companion_voice text,
+    interests text
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT s.id, u.id, u.first_name, u.phone_number, u.companion_name, u.companion_voice, u.interests
+    FROM call_schedule s
+    JOIN users u ON u.id = s.user_id
+    WHERE s.enabled
+      AND s.day_of_week = dow_name
+      AND s.call_time = now_hhmm
+      AND (s.last_called_at IS NULL OR s.last_called_at < today_start);
+$$;
@@ -0,0 +1,171 @@
+"""
+Scheduler worker: runs run_scheduler_tick at the start of every minute.
+
+Runs as its own process (`python worker.py`), deployed as a separate
+single-replica service from the web app, so scaling the web app never
+multiplies scheduled calls and ticks don't compete with request handlers.
+"""
+import os
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import asyncpg
+
+# --------------------
+# Config
+# --------------------
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
+
+# Postgres connection string for the Supabase database.
+# Point this at the Supavisor transaction pooler, e.g.
+# postgresql://postgres.<ref>:<password>@<region>.pooler.supabase.com:6543/postgres?sslmode=require
+DATABASE_URL = os.environ["DATABASE_URL"]
+# Keep the pool small: Supabase caps client connections per project
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "5"))
+
+UK_TZ = ZoneInfo("Europe/London")
+UTC = ZoneInfo("UTC")
+
+# call_schedule.day_of_week values, indexed by datetime.weekday() (Mon=0)
+DOW_TO_DAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# How often the scheduler re-checks the clock in the last second before a minute boundary
+SCHEDULER_POLL_SECONDS = 0.333
+# If the loop falls further behind than this (e.g. the host was suspended), skip ahead
+# rather than firing a backlog of stale minutes
+SCHEDULER_MAX_CATCHUP = timedelta(minutes=5)
+
+# Created in main()
+db_pool: asyncpg.Pool | None = None
+
+
+async def run_scheduler_tick(now: datetime):
+    """
+    Runs once per minute, for the UK minute `now` (seconds zeroed):
+    - fetch enabled schedules that match now (day + HH:MM) and weren't called today,
+      joined with their users, in one due_calls() query (see supabase/migrations)
+    - if any are due, in one transaction holding the scheduler advisory lock, re-fetch
+      them, insert a call_logs row for each and update last_called_at on all of them
+    """
+    now_hhmm = f"{now.hour:02d}:{now.minute:02d}"
+    # Start of today in the UK; "called today" is just last_called_at >= this
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    dow = now.weekday()  # Mon=0
+
+    logging.debug(f"[tick] UK now={now.isoformat(timespec='minutes')} (dow={dow}) checking schedules...")
+
+    due_args = (now_hhmm, DOW_TO_DAY[dow], today_start)
+
+    # Nearly every minute is idle: stop after the one (index-backed, empty) query,
+    # without opening a transaction or taking the lock
+    if not await db_pool.fetch("SELECT * FROM due_calls($1, $2, $3)", *due_args):
+        logging.debug("[tick] No calls due this minute.")
+        return
+
+    async with db_pool.acquire() as conn, conn.transaction():
+        # Only one worker may tick at a time (e.g. old and new replicas overlapping
+        # during a rollout). The lock is transaction-scoped, so it works through the
+        # transaction pooler and is released on commit or when the holder dies. Wait
+        # for it rather than skip: the holder may be on a different (catch-up) minute,
+        # and due_calls() matches call_time exactly, so a skipped minute is never called.
+        await conn.execute("SELECT pg_advisory_xact_lock(hashtext('scheduler_tick'))")
+
+        # Re-fetch under the lock: a worker that held it before us may have called
+        # them since the check above
+        due = await conn.fetch("SELECT * FROM due_calls($1, $2, $3)", *due_args)
+        if not due:
+            logging.debug("[tick] No calls due this minute.")
+            return
+
+        logging.info(f"[tick] UK now={now.isoformat(timespec='minutes')}: {len(due)} schedule(s) due.")
+
+        now_utc = now.astimezone(UTC)
+
+        # Build one call_logs row per due schedule (stub for now; later Twilio will fill
+        # duration/recording/answered)
+        log_rows = []
+        for d in due:
+            logging.info(
+                f"[DUE] Would call user={d['first_name']} ({d['phone_number']}) "
+                f"voice={d['companion_voice']} companion={d['companion_name']} schedule_id={d['schedule_id']}"
+            )
+
+            log_rows.append((
+                d["user_id"],
+                now_utc,
+                0,
+                False,
+                None,
+                "Scheduler triggered (Twilio not yet connected).",
+                "neutral",
+                d["interests"] or "",
+            ))
+        called_ids = [d["schedule_id"] for d in due]
+
+        await conn.executemany(
+            """
+            INSERT INTO call_logs
+                (user_id, call_time, duration_seconds, answered, recording_url, summary, mood, topics)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            """,
+            log_rows,
+        )
+        # Update last_called_at so we don't re-trigger today
+        await conn.execute("SELECT update_last_called($1::uuid[], $2)", called_ids, now_utc)
+
+
+async def scheduler_loop():
+    # Step through minutes in UTC so DST changes can't shift or skip a step
+    next_tick = datetime.now(UTC).replace(second=0, microsecond=0)
+    while True:
+        now = datetime.now(UTC)
+        if now < next_tick:
+            # Sleep to just short of the boundary, then poll so a clock
+            # adjustment while sleeping can't carry us past it
+            remaining = (next_tick - now).total_seconds()
+            await asyncio.sleep(remaining - 1 if remaining > 1 else min(remaining, SCHEDULER_POLL_SECONDS))
+            continue
+
+        if now - next_tick > SCHEDULER_MAX_CATCHUP:
+            logging.warning(f"[tick] Scheduler fell behind to {next_tick.isoformat()}, skipping ahead.")
+            next_tick = now.replace(second=0, microsecond=0)
+
+        try:
+            await run_scheduler_tick(next_tick.astimezone(UK_TZ))
+        except Exception as e:
+            logging.exception(f"[tick] Error: {e}")
+
+        # Advance by exactly one minute: a tick that overruns its minute
+        # is followed straight away by the next one instead of dropping it
+        next_tick += timedelta(minutes=1)
+
+
+async def main():
+    global db_pool
+
+    db_pool = await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        # Recycle idle connections before the pooler drops them
+        max_inactive_connection_lifetime=1800,
+        # Connect timeout, so a pooler outage fails the tick instead of hanging it
+        timeout=30,
+        # Per-statement timeout, so a stuck query fails the tick rather than
+        # leaving the loop awaiting forever
+        command_timeout=30,
+        # Supavisor in transaction mode can't hold server-side prepared statements
+        statement_cache_size=0,
+    )
+    logging.info("Scheduler started.")
+    try:
+        await scheduler_loop()
+    finally:
+        await db_pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())